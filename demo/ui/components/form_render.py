@@ -69,7 +69,7 @@ class State:
 
 def is_form(message: StateMessage) -> bool:
     """Returns whether the message indicates a form should be rendered"""
-    if any([x[1] == 'form' for x in message.content]):
+    if any(x[1] == 'form' for x in message.content):
         return True
     return False
 
@@ -1,6 +1,7 @@
 import base64
 import datetime
 import json
+import logging
 import os
 import uuid
 
@@ -34,6 +35,9 @@ from service.types import Conversation, Event
 from utils.agent_card import get_agent_card
 
 
+logger = logging.getLogger(__name__)
+
+
 class ADKHostManager(ApplicationManager):
     """An implementation of memory based management with fake agent actions
 
@@ -97,6 +101,9 @@ class ADKHostManager(ApplicationManager):
                 # Reinitialize host with new API key
                 self._initialize_host()
 
+    async def aclose(self):
+        await self._host_agent.aclose()
+
     def _initialize_host(self):
         agent = self._host_agent.create_agent()
         self._host_runner = Runner(
@@ -136,6 +143,15 @@ class ADKHostManager(ApplicationManager):
         return message
 
     async def process_message(self, message: Message):
+        message_id = get_message_id(message)
+        try:
+            await self._process_message(message)
+        finally:
+            # A message that failed is no longer pending either.
+            if message_id in self._pending_message_ids:
+                self._pending_message_ids.remove(message_id)
+
+    async def _process_message(self, message: Message):
         self._messages.append(message)
         message_id = get_message_id(message)
         if message_id:
@@ -230,7 +246,6 @@ class ADKHostManager(ApplicationManager):
 
         if conversation:
             conversation.messages.append(response)
-        self._pending_message_ids.remove(message_id)
 
     def add_task(self, task: Task):
         self._tasks.append(task)
@@ -339,8 +354,8 @@ class ADKHostManager(ApplicationManager):
         ]:
             task.history.append(task.status.message)
         else:
-            print(
-                'Message id already in history',
+            logger.debug(
+                'Message id already in history: %s %r',
                 get_message_id(task.status.message),
                 task.history,
             )
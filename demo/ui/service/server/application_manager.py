@@ -21,6 +21,14 @@ class ApplicationManager(ABC):
     def register_agent(self, url: str):
         pass
 
+    async def aclose(self) -> None:
+        """Releases resources held by the manager on server shutdown.
+
+        Most managers hold nothing to release, so this is optional to
+        override.
+        """
+        return None
+
     @abstractmethod
     def get_pending_messages(self) -> list[str]:
         pass
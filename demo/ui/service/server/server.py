@@ -1,5 +1,7 @@
 import asyncio
 import base64
+import concurrent.futures
+import logging
 import os
 import threading
 import uuid
@@ -24,6 +26,9 @@ from .application_manager import ApplicationManager
 from .in_memory_manager import InMemoryFakeAgentManager
 
 
+logger = logging.getLogger(__name__)
+
+
 class ConversationServer:
     """ConversationServer is the backend to serve the agent interactions in the UI
 
@@ -47,6 +52,12 @@ class ConversationServer:
             )
         else:
             self.manager = InMemoryFakeAgentManager()
+        # Messages are processed on one long-lived event loop in a background
+        # thread. The host agent keeps pooled connections that are bound to
+        # the loop that opened them, so they must not span several loops.
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._closed = False
         self._file_cache = {}  # dict[str, FilePart] maps file id to message data
         self._message_to_cache = {}  # dict[str, str] maps message id to cache id
 
@@ -77,12 +88,24 @@ class ConversationServer:
         router.add_api_route(
             '/api_key/update', self._update_api_key, methods=['POST']
         )
+        router.add_event_handler('shutdown', self._shutdown)
 
     # Update API key in manager
     def update_api_key(self, api_key: str):
         if isinstance(self.manager, ADKHostManager):
             self.manager.update_api_key(api_key)
 
+    async def _shutdown(self) -> None:
+        # The handler can be registered both on the router and on the app that
+        # includes it, so it may run more than once.
+        if self._closed:
+            return
+        self._closed = True
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self.manager.aclose(), self._loop)
+        )
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
     def _create_conversation(self):
         c = self.manager.create_conversation()
         return CreateConversationResponse(result=c)
@@ -91,10 +114,10 @@ class ConversationServer:
         message_data = await request.json()
         message = Message(**message_data['params'])
         message = self.manager.sanitize_message(message)
-        t = threading.Thread(
-            target=lambda: asyncio.run(self.manager.process_message(message))
+        future = asyncio.run_coroutine_threadsafe(
+            self.manager.process_message(message), self._loop
         )
-        t.start()
+        future.add_done_callback(_log_processing_error)
         return SendMessageResponse(
             result=MessageInfo(
                 message_id=message.metadata['message_id'],
@@ -164,7 +187,9 @@ class ConversationServer:
     async def _register_agent(self, request: Request):
         message_data = await request.json()
         url = message_data['params']
-        self.manager.register_agent(url)
+        # Fetching the agent card is a blocking HTTP request, so it runs on a
+        # worker thread to keep the server's event loop responsive.
+        await asyncio.to_thread(self.manager.register_agent, url)
         return RegisterAgentResponse()
 
     async def _list_agents(self):
@@ -194,3 +219,9 @@ class ConversationServer:
             return {'status': 'error', 'message': 'No API key provided'}
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
+
+
+def _log_processing_error(future: concurrent.futures.Future) -> None:
+    # Nothing awaits a processed message, so a failure would otherwise be lost.
+    if not future.cancelled() and future.exception() is not None:
+        logger.error('Failed to process message', exc_info=future.exception())
@@ -65,7 +65,6 @@ def generate_image_tool(
 
     ref_image = None
     logger.info(f'Session id {session_id}')
-    print(f'Session id {session_id}')
 
     # TODO (rvelicheti) - Change convoluted memory handling logic to a better
     # version.
@@ -84,7 +83,7 @@ def generate_image_tool(
                 ref_image_data = None
         if not ref_image_data:
             # Insertion order is maintained from python 3.7
-            latest_image_key = list(session_image_data.keys())[-1]
+            latest_image_key = next(reversed(session_image_data))
             ref_image_data = session_image_data[latest_image_key]
 
         ref_bytes = base64.b64decode(ref_image_data.bytes)
@@ -107,7 +106,6 @@ def generate_image_tool(
         )
     except Exception as e:
         logger.error(f'Error generating image {e}')
-        print(f'Exception {e}')
         return -999999999
 
     for part in response.candidates[0].content.parts:
@@ -132,7 +130,6 @@ def generate_image_tool(
                 return data.id
             except Exception as e:
                 logger.error(f'Error unpacking image {e}')
-                print(f'Exception {e}')
     return -999999999
 
 
@@ -216,7 +213,6 @@ class ImageGenerationAgent:
             'artifact_file_id': artifact_file_id,
         }
         logger.info(f'Inputs {inputs}')
-        print(f'Inputs {inputs}')
         response = self.image_crew.kickoff(inputs)
         return response
 
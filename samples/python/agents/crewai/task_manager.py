@@ -113,7 +113,7 @@ class AgentTaskManager(InMemoryTaskManager):
         else:
             parts = [{'type': 'text', 'text': data.error}]
 
-        print(f'Final Result ===> {result}')
+        logger.debug('Final Result ===> %s', result)
         task = await self._update_store(
             task_send_params.id,
             TaskStatus(state=TaskState.COMPLETED),
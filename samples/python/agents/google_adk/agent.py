@@ -1,19 +1,38 @@
 import json
-import random
+import os
 
+from collections import OrderedDict
 from typing import Any
 
 from google.adk.agents.llm_agent import LlmAgent
-from google.adk.artifacts import InMemoryArtifactService
+from google.adk.artifacts import BaseArtifactService, InMemoryArtifactService
+from google.adk.memory import BaseMemoryService
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import BaseSessionService, InMemorySessionService
 from google.adk.tools.tool_context import ToolContext
 from task_manager import AgentWithTaskManager
 
 
-# Local cache of created request_ids for demo purposes.
-request_ids = set()
+# Local cache of created request_ids for demo purposes. Only the most recent
+# ids are kept so that a long-running agent does not grow without bound.
+MAX_REQUEST_IDS = 10_000
+request_ids: OrderedDict[str, None] = OrderedDict()
+
+# Default ADK services shared by all ReimbursementAgent instances.
+_artifact_service = InMemoryArtifactService()
+_session_service = InMemorySessionService()
+_memory_service = InMemoryMemoryService()
+
+
+def _register_request_id(request_id: str) -> None:
+    request_ids[request_id] = None
+    if len(request_ids) > MAX_REQUEST_IDS:
+        request_ids.popitem(last=False)
+
+
+def _is_valid_request_id(request_id: str) -> bool:
+    return request_id in request_ids
 
 
 def create_request_form(
@@ -31,8 +50,8 @@ def create_request_form(
     Returns:
         dict[str, Any]: A dictionary containing the request form data.
     """
-    request_id = 'request_id_' + str(random.randint(1000000, 9999999))
-    request_ids.add(request_id)
+    request_id = f'request_id_{os.urandom(4).hex()}'
+    _register_request_id(request_id)
     return {
         'request_id': request_id,
         'date': '<transaction date>' if not date else date,
@@ -43,6 +62,34 @@ def create_request_form(
     }
 
 
+# The schema of the reimbursement form never changes, so it is built once and
+# shared by every form returned to the user.
+FORM_PROPERTIES = {
+    'date': {
+        'type': 'string',
+        'format': 'date',
+        'description': 'Date of expense',
+        'title': 'Date',
+    },
+    'amount': {
+        'type': 'string',
+        'format': 'number',
+        'description': 'Amount of expense',
+        'title': 'Amount',
+    },
+    'purpose': {
+        'type': 'string',
+        'description': 'Purpose of expense',
+        'title': 'Purpose',
+    },
+    'request_id': {
+        'type': 'string',
+        'description': 'Request id',
+        'title': 'Request ID',
+    },
+}
+
+
 def return_form(
     form_request: dict[str, Any],
     tool_context: ToolContext,
@@ -58,7 +105,7 @@ def return_form(
     Returns:
         dict[str, Any]: A JSON dictionary for the form response.
     """
-    if isinstance(form_request, str):
+    if isinstance(form_request, str | bytes):
         form_request = json.loads(form_request)
 
     tool_context.actions.skip_summarization = True
@@ -67,31 +114,8 @@ def return_form(
         'type': 'form',
         'form': {
             'type': 'object',
-            'properties': {
-                'date': {
-                    'type': 'string',
-                    'format': 'date',
-                    'description': 'Date of expense',
-                    'title': 'Date',
-                },
-                'amount': {
-                    'type': 'string',
-                    'format': 'number',
-                    'description': 'Amount of expense',
-                    'title': 'Amount',
-                },
-                'purpose': {
-                    'type': 'string',
-                    'description': 'Purpose of expense',
-                    'title': 'Purpose',
-                },
-                'request_id': {
-                    'type': 'string',
-                    'description': 'Request id',
-                    'title': 'Request ID',
-                },
-            },
-            'required': list(form_request.keys()),
+            'properties': FORM_PROPERTIES,
+            'required': list(form_request),
         },
         'form_data': form_request,
         'instructions': instructions,
@@ -101,7 +125,7 @@ def return_form(
 
 def reimburse(request_id: str) -> dict[str, Any]:
     """Reimburse the amount of money to the employee for a given request_id."""
-    if request_id not in request_ids:
+    if not _is_valid_request_id(request_id):
         return {
             'request_id': request_id,
             'status': 'Error: Invalid request_id.',
@@ -114,15 +138,23 @@ class ReimbursementAgent(AgentWithTaskManager):
 
     SUPPORTED_CONTENT_TYPES = ['text', 'text/plain']
 
-    def __init__(self):
+    def __init__(
+        self,
+        artifact_service: BaseArtifactService | None = None,
+        session_service: BaseSessionService | None = None,
+        memory_service: BaseMemoryService | None = None,
+    ):
         self._agent = self._build_agent()
         self._user_id = 'remote_agent'
+        # Unless other services are injected, every instance shares the
+        # process-wide in-memory services, so sessions survive re-creation of
+        # the agent.
         self._runner = Runner(
             app_name=self._agent.name,
             agent=self._agent,
-            artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
-            memory_service=InMemoryMemoryService(),
+            artifact_service=artifact_service or _artifact_service,
+            session_service=session_service or _session_service,
+            memory_service=memory_service or _memory_service,
         )
 
     def get_processing_message(self) -> str:
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 
@@ -29,6 +30,9 @@ from google.genai import types
 
 logger = logging.getLogger(__name__)
 
+# Minimum number of seconds between two streamed processing updates.
+PROCESSING_UPDATE_INTERVAL = 0.25
+
 
 # TODO: Move this class (or these classes) to a common directory
 class AgentWithTaskManager(ABC):
@@ -36,86 +40,88 @@ class AgentWithTaskManager(ABC):
     def get_processing_message(self) -> str:
         pass
 
-    def invoke(self, query, session_id) -> str:
-        session = self._runner.session_service.get_session(
+    def _get_or_create_session(self, session_id):
+        session_service = self._runner.session_service
+        session = session_service.get_session(
             app_name=self._agent.name,
             user_id=self._user_id,
             session_id=session_id,
         )
-        content = types.Content(
-            role='user', parts=[types.Part.from_text(text=query)]
-        )
         if session is None:
-            session = self._runner.session_service.create_session(
+            session = session_service.create_session(
                 app_name=self._agent.name,
                 user_id=self._user_id,
                 state={},
                 session_id=session_id,
             )
-        events = list(
-            self._runner.run(
-                user_id=self._user_id,
-                session_id=session.id,
-                new_message=content,
-            )
+        return session
+
+    async def invoke(self, query, session_id) -> str:
+        session = self._get_or_create_session(session_id)
+        content = types.Content(
+            role='user', parts=[types.Part.from_text(text=query)]
         )
-        if not events or not events[-1].content or not events[-1].content.parts:
+        # Only the final event is needed, so keep just the latest one instead
+        # of materializing the whole event stream.
+        last_event = None
+        async for event in self._runner.run_async(
+            user_id=self._user_id, session_id=session.id, new_message=content
+        ):
+            last_event = event
+        if (
+            not last_event
+            or not last_event.content
+            or not last_event.content.parts
+        ):
             return ''
-        return '\n'.join([p.text for p in events[-1].content.parts if p.text])
+        return '\n'.join([p.text for p in last_event.content.parts if p.text])
 
     async def stream(self, query, session_id) -> AsyncIterable[dict[str, Any]]:
-        session = self._runner.session_service.get_session(
-            app_name=self._agent.name,
-            user_id=self._user_id,
-            session_id=session_id,
-        )
+        session = self._get_or_create_session(session_id)
         content = types.Content(
             role='user', parts=[types.Part.from_text(text=query)]
         )
-        if session is None:
-            session = self._runner.session_service.create_session(
-                app_name=self._agent.name,
-                user_id=self._user_id,
-                state={},
-                session_id=session_id,
-            )
+        loop = asyncio.get_running_loop()
+        last_update_at = None
         async for event in self._runner.run_async(
             user_id=self._user_id, session_id=session.id, new_message=content
         ):
             if event.is_final_response():
-                response = ''
-                if (
-                    event.content
-                    and event.content.parts
-                    and event.content.parts[0].text
-                ):
-                    response = '\n'.join(
-                        [p.text for p in event.content.parts if p.text]
-                    )
-                elif (
-                    event.content
-                    and event.content.parts
-                    and any(
-                        [
-                            True
-                            for p in event.content.parts
-                            if p.function_response
-                        ]
-                    )
-                ):
-                    response = next(
-                        p.function_response.model_dump()
-                        for p in event.content.parts
-                    )
+                response = _extract_response(event)
                 yield {
                     'is_task_complete': True,
                     'content': response,
                 }
             else:
-                yield {
-                    'is_task_complete': False,
-                    'updates': self.get_processing_message(),
-                }
+                # Intermediate events all produce the same processing message,
+                # so send at most one per interval instead of one per event.
+                now = loop.time()
+                if (
+                    last_update_at is None
+                    or now - last_update_at >= PROCESSING_UPDATE_INTERVAL
+                ):
+                    last_update_at = now
+                    yield {
+                        'is_task_complete': False,
+                        'updates': self.get_processing_message(),
+                    }
+
+
+def _extract_response(event) -> str | dict[str, Any]:
+    """Returns the final response carried by an event.
+
+    This is the text of the event when its first part is text, or else its
+    first function response.
+    """
+    if not event.content or not event.content.parts:
+        return ''
+    parts = event.content.parts
+    if parts[0].text:
+        return '\n'.join(p.text for p in parts if p.text)
+    for p in parts:
+        if p.function_response:
+            return p.function_response.model_dump()
+    return ''
 
 
 class AgentTaskManager(InMemoryTaskManager):
@@ -251,7 +257,7 @@ class AgentTaskManager(InMemoryTaskManager):
         task_send_params: TaskSendParams = request.params
         query = self._get_user_query(task_send_params)
         try:
-            result = self.agent.invoke(query, task_send_params.sessionId)
+            result = await self.agent.invoke(query, task_send_params.sessionId)
         except Exception as e:
             logger.error(f'Error invoking agent: {e}')
             raise ValueError(f'Error invoking agent: {e}')
@@ -75,8 +75,8 @@ class LlamaIndexTaskManager(InMemoryTaskManager):
             handler = None
 
             # Check if we have a saved context state for this session
-            print(f'Len of tasks: {len(self.tasks)}', flush=True)
-            print(f'Len of ctx_states: {len(self.ctx_states)}', flush=True)
+            logger.debug('Len of tasks: %d', len(self.tasks))
+            logger.debug('Len of ctx_states: %d', len(self.ctx_states))
             saved_ctx_state = self.ctx_states.get(session_id, None)
 
             if saved_ctx_state is not None:
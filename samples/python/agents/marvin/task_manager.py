@@ -51,7 +51,7 @@ class AgentTaskManager(InMemoryTaskManager):
         require_user_input = not is_task_complete
         data = agent_outcome.get("data", {})
         text_parts = agent_outcome.get("text_parts", [])
-        print(f"Data: {data}")
+        logger.debug("Data: %s", data)
         parts = []
         parts.extend(text_parts)
 
@@ -1,5 +1,5 @@
 from .card_resolver import A2ACardResolver
-from .client import A2AClient
+from .client import A2AClient, new_httpx_client
 
 
-__all__ = ['A2ACardResolver', 'A2AClient']
+__all__ = ['A2ACardResolver', 'A2AClient', 'new_httpx_client']
@@ -1,12 +1,13 @@
 import json
 
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
 
 from httpx._types import TimeoutTypes
-from httpx_sse import connect_sse
+from httpx_sse import aconnect_sse
 
 from common.types import (
     A2AClientHTTPError,
@@ -28,12 +29,27 @@ from common.types import (
 )
 
 
+def _json_headers() -> dict[str, str]:
+    # Requests are serialized straight to JSON by pydantic rather than dumped
+    # to a dict and re-encoded by httpx. A new dict is returned on every call
+    # because httpx-sse adds its own headers to the dict it is given.
+    return {'Content-Type': 'application/json'}
+
+
+def new_httpx_client() -> httpx.AsyncClient:
+    """Creates an async HTTP client with a keep-alive connection pool."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+
+
 class A2AClient:
     def __init__(
         self,
         agent_card: AgentCard = None,
         url: str = None,
         timeout: TimeoutTypes = 60.0,
+        httpx_client: httpx.AsyncClient | None = None,
     ):
         if agent_card:
             self.url = agent_card.url
@@ -42,6 +58,20 @@ class A2AClient:
         else:
             raise ValueError('Must provide either agent_card or url')
         self.timeout = timeout
+        # A caller may pass in a client to share one keep-alive pool between
+        # requests and A2AClients. Its connections are bound to the event loop
+        # that opened them, so the caller must only use it from that loop.
+        # Without one, each request gets a short-lived client, which is safe
+        # from any event loop.
+        self._httpx_client = httpx_client
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._httpx_client is not None:
+            yield self._httpx_client
+            return
+        async with httpx.AsyncClient() as client:
+            yield client
 
     async def send_task(self, payload: dict[str, Any]) -> SendTaskResponse:
         request = SendTaskRequest(params=payload)
@@ -51,24 +81,34 @@ class A2AClient:
         self, payload: dict[str, Any]
     ) -> AsyncIterable[SendTaskStreamingResponse]:
         request = SendTaskStreamingRequest(params=payload)
-        with httpx.Client(timeout=None) as client:
-            with connect_sse(
-                client, 'POST', self.url, json=request.model_dump()
-            ) as event_source:
-                try:
-                    for sse in event_source.iter_sse():
-                        yield SendTaskStreamingResponse(**json.loads(sse.data))
-                except json.JSONDecodeError as e:
-                    raise A2AClientJSONError(str(e)) from e
-                except httpx.RequestError as e:
-                    raise A2AClientHTTPError(400, str(e)) from e
+        async with (
+            self._client() as client,
+            aconnect_sse(
+                client,
+                'POST',
+                self.url,
+                content=request.model_dump_json(),
+                headers=_json_headers(),
+                timeout=None,
+            ) as event_source,
+        ):
+            try:
+                async for sse in event_source.aiter_sse():
+                    yield SendTaskStreamingResponse(**json.loads(sse.data))
+            except json.JSONDecodeError as e:
+                raise A2AClientJSONError(str(e)) from e
+            except httpx.RequestError as e:
+                raise A2AClientHTTPError(400, str(e)) from e
 
     async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             try:
                 # Image generation could take time, adding timeout
                 response = await client.post(
-                    self.url, json=request.model_dump(), timeout=self.timeout
+                    self.url,
+                    content=request.model_dump_json(),
+                    headers=_json_headers(),
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
                 return response.json()
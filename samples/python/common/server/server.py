@@ -8,7 +8,7 @@ from pydantic import ValidationError
 from sse_starlette.sse import EventSourceResponse
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from common.server.task_manager import TaskManager
 from common.types import (
@@ -121,9 +121,7 @@ class A2AServer:
             response.model_dump(exclude_none=True), status_code=400
         )
 
-    def _create_response(
-        self, result: Any
-    ) -> JSONResponse | EventSourceResponse:
+    def _create_response(self, result: Any) -> Response | EventSourceResponse:
         if isinstance(result, AsyncIterable):
 
             async def event_generator(result) -> AsyncIterable[dict[str, str]]:
@@ -132,6 +130,9 @@ class A2AServer:
 
             return EventSourceResponse(event_generator(result))
         if isinstance(result, JSONRPCResponse):
-            return JSONResponse(result.model_dump(exclude_none=True))
+            return Response(
+                result.model_dump_json(exclude_none=True),
+                media_type='application/json',
+            )
         logger.error(f'Unexpected result type: {type(result)}')
         raise ValueError(f'Unexpected result type: {type(result)}')
@@ -113,11 +113,17 @@ class PushNotificationReceiverAuth(PushNotificationAuth):
         self.jwks_client = None
 
     async def load_jwks(self, jwks_url: str):
-        self.jwks_client = PyJWKClient(jwks_url)
+        # Keep parsed signing keys by kid, on top of the cached JWK set, so a
+        # notification only hits the network or re-parses a key for a new kid.
+        self.jwks_client = PyJWKClient(jwks_url, cache_keys=True)
 
     async def verify_push_notification(self, request: Request) -> bool:
         auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith(AUTH_HEADER_PREFIX):
+        if (
+            not auth_header
+            or len(auth_header) <= len(AUTH_HEADER_PREFIX)
+            or not auth_header.startswith(AUTH_HEADER_PREFIX)
+        ):
             print('Invalid authorization header')
             return False
 
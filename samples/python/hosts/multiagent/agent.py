@@ -1,4 +1,8 @@
 from .host_agent import HostAgent
 
 
+# Entry point for `adk web` and `adk run`. The host agent lives as long as the
+# process, and so does its pool of connections to the remote agents. Nothing
+# closes the pool; its sockets are released when the process exits. Hosts
+# with a shorter lifetime should call `HostAgent.aclose()` instead.
 root_agent = HostAgent(['http://localhost:10000']).create_agent()
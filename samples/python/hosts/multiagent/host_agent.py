@@ -1,8 +1,13 @@
+import asyncio
 import base64
 import json
 import uuid
 
-from common.client import A2ACardResolver
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from common.client import A2ACardResolver, new_httpx_client
 from common.types import (
     AgentCard,
     DataPart,
@@ -22,6 +27,44 @@ from google.genai import types
 from .remote_agent_connection import RemoteAgentConnections, TaskUpdateCallback
 
 
+ROOT_INSTRUCTION = """You are an expert delegator that can delegate the user request to the
+appropriate remote agents.
+
+Discovery:
+- You can use `list_remote_agents` to list the available remote agents you
+can use to delegate the task.
+
+Execution:
+- For actionable tasks, you can use `create_task` to assign tasks to remote agents to perform.
+Be sure to include the remote agent name when you respond to the user.
+- When the request needs several independent tasks, use `send_tasks` to send
+them to the remote agents at the same time, with one message per agent name.
+
+You can use `check_pending_task_states` to check the states of the pending
+tasks.
+
+Please rely on tools to address the request, and don't make up the response. If you are not sure, please ask the user for more details.
+Focus on the most recent parts of the conversation primarily.
+
+If there is an active agent, send the request to that agent with the update task tool.
+
+Agents:
+{agents}
+
+Current agent: {active_agent}
+"""
+
+# The maximum number of tasks `send_tasks` has in flight at once.
+MAX_CONCURRENT_TASKS = 8
+
+# Files already saved as artifacts while converting one task, keyed by file
+# name, with the base64 payload they were saved from.
+SavedFiles = dict[str, tuple[str, DataPart]]
+
+# What a remote agent's part is converted to for the host agent's model.
+ConvertedPart = str | dict[str, Any] | DataPart
+
+
 class HostAgent:
     """The host agent.
 
@@ -35,27 +78,33 @@ class HostAgent:
         task_callback: TaskUpdateCallback | None = None,
     ):
         self.task_callback = task_callback
+        # A single connection pool shared by every remote agent connection, so
+        # agents served from the same host reuse the same keep-alive sockets.
+        self.httpx_client = new_httpx_client()
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
-        for address in remote_agent_addresses:
-            card_resolver = A2ACardResolver(address)
-            card = card_resolver.get_agent_card()
-            remote_connection = RemoteAgentConnections(card)
+        for card in resolve_agent_cards(remote_agent_addresses):
+            remote_connection = RemoteAgentConnections(card, self.httpx_client)
             self.remote_agent_connections[card.name] = remote_connection
             self.cards[card.name] = card
-        agent_info = []
-        for ra in self.list_remote_agents():
-            agent_info.append(json.dumps(ra))
-        self.agents = '\n'.join(agent_info)
+        self._update_agents_info()
 
     def register_agent_card(self, card: AgentCard):
-        remote_connection = RemoteAgentConnections(card)
+        remote_connection = RemoteAgentConnections(card, self.httpx_client)
         self.remote_agent_connections[card.name] = remote_connection
         self.cards[card.name] = card
-        agent_info = []
-        for ra in self.list_remote_agents():
-            agent_info.append(json.dumps(ra))
-        self.agents = '\n'.join(agent_info)
+        self._update_agents_info()
+
+    def _update_agents_info(self) -> None:
+        # The agent descriptions only change when a card is registered, so
+        # they are rendered once here rather than on every model turn.
+        self.agents = '\n'.join(
+            json.dumps(ra) for ra in self.list_remote_agents()
+        )
+
+    async def aclose(self):
+        """Closes the connection pool shared by the remote agent connections."""
+        await self.httpx_client.aclose()
 
     def create_agent(self) -> Agent:
         return Agent(
@@ -70,35 +119,15 @@ class HostAgent:
             tools=[
                 self.list_remote_agents,
                 self.send_task,
+                self.send_tasks,
             ],
         )
 
     def root_instruction(self, context: ReadonlyContext) -> str:
         current_agent = self.check_state(context)
-        return f"""You are an expert delegator that can delegate the user request to the
-appropriate remote agents.
-
-Discovery:
-- You can use `list_remote_agents` to list the available remote agents you
-can use to delegate the task.
-
-Execution:
-- For actionable tasks, you can use `create_task` to assign tasks to remote agents to perform.
-Be sure to include the remote agent name when you respond to the user.
-
-You can use `check_pending_task_states` to check the states of the pending
-tasks.
-
-Please rely on tools to address the request, and don't make up the response. If you are not sure, please ask the user for more details.
-Focus on the most recent parts of the conversation primarily.
-
-If there is an active agent, send the request to that agent with the update task tool.
-
-Agents:
-{self.agents}
-
-Current agent: {current_agent['active_agent']}
-"""
+        return ROOT_INSTRUCTION.format(
+            agents=self.agents, active_agent=current_agent['active_agent']
+        )
 
     def check_state(self, context: ReadonlyContext):
         state = context.state
@@ -147,31 +176,153 @@ Current agent: {current_agent['active_agent']}
         Yields:
           A dictionary of JSON data.
         """
-        if agent_name not in self.remote_agent_connections:
-            raise ValueError(f'Agent {agent_name} not found')
+        client = self._get_connection(agent_name)
         state = tool_context.state
         state['agent'] = agent_name
-        card = self.cards[agent_name]
-        client = self.remote_agent_connections[agent_name]
-        if not client:
-            raise ValueError(f'Client not available for {agent_name}')
         if 'task_id' in state:
             taskId = state['task_id']
         else:
-            taskId = str(uuid.uuid4())
-        sessionId = state['session_id']
-        task: Task
+            taskId = uuid.uuid4().hex
         messageId = ''
+        if 'input_message_metadata' in state:
+            messageId = state['input_message_metadata'].get('message_id', '')
+        if not messageId:
+            messageId = uuid.uuid4().hex
+        task = await self._send_remote_task(
+            client, message, state, taskId, messageId
+        )
+        # Assume completion unless a state returns that isn't complete
+        state['session_active'] = is_task_open(task)
+        if task.status.state == TaskState.INPUT_REQUIRED:
+            # Force user input back
+            tool_context.actions.skip_summarization = True
+            tool_context.actions.escalate = True
+        error = get_task_error(agent_name, task)
+        if error:
+            raise ValueError(error)
+        return convert_task(task, tool_context)
+
+    async def send_tasks(
+        self,
+        agent_names: list[str],
+        messages: list[str],
+        tool_context: ToolContext,
+    ):
+        """Sends several independent tasks to remote agents concurrently.
+
+        Every task is sent as a new remote task with its own task and message
+        ids, so none of them continues the active task of the conversation.
+        A task that fails, or that is missing its agent name or message, does
+        not stop the others and is reported in its own result.
+
+        Once all tasks are done, the session stays active if any task is still
+        open. One open task becomes the active task, and its agent the active
+        agent, so that the next `send_task` continues it: the first task, in
+        the order of `agent_names`, that requires input, or else the first
+        task that is still open. The active task and agent are left unchanged
+        when every task is closed. If any task requires input, control is
+        handed back to the user.
+
+        Args:
+          agent_names: The names of the agents to send the tasks to.
+          messages: The message of each task, in the same order as
+            `agent_names`.
+          tool_context: The tool context this method runs in.
+
+        Returns:
+          One dictionary per task, in the same order as `agent_names`, with the
+          `agent_name` and either the `response` of the task or the `error`
+          that stopped it.
+        """
+        # The lists come from the model and may not line up, so the shorter
+        # one is padded and each unpaired entry fails on its own.
+        count = max(len(agent_names), len(messages))
+        agent_names = agent_names + [''] * (count - len(agent_names))
+        messages = messages + [''] * (count - len(messages))
+        state = tool_context.state
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TASKS)
+
+        async def send(agent_name: str, message: str) -> Task:
+            if not agent_name:
+                raise ValueError(f'No agent name for message {message!r}')
+            if not message:
+                raise ValueError(f'No message for agent {agent_name}')
+            client = self._get_connection(agent_name)
+            async with semaphore:
+                return await self._send_remote_task(
+                    client,
+                    message,
+                    state,
+                    uuid.uuid4().hex,
+                    uuid.uuid4().hex,
+                )
+
+        results = await asyncio.gather(
+            *(send(*task) for task in zip(agent_names, messages, strict=True)),
+            return_exceptions=True,
+        )
+        for result in results:
+            # Only errors are reported per task; cancellation still propagates.
+            if isinstance(result, BaseException) and not isinstance(
+                result, Exception
+            ):
+                raise result
+        responses = []
+        open_tasks: list[tuple[str, Task]] = []
+        for agent_name, result in zip(agent_names, results, strict=True):
+            error = (
+                str(result)
+                if isinstance(result, Exception)
+                else get_task_error(agent_name, result)
+            )
+            if error:
+                responses.append({'agent_name': agent_name, 'error': error})
+                continue
+            if is_task_open(result):
+                open_tasks.append((agent_name, result))
+            if result.status.state == TaskState.INPUT_REQUIRED:
+                tool_context.actions.skip_summarization = True
+                tool_context.actions.escalate = True
+            responses.append(
+                {
+                    'agent_name': agent_name,
+                    'response': convert_task(result, tool_context),
+                }
+            )
+        state['session_active'] = bool(open_tasks)
+        if open_tasks:
+            # Prefer a task waiting on the user, who is about to be asked.
+            agent_name, task = min(
+                open_tasks,
+                key=lambda t: t[1].status.state != TaskState.INPUT_REQUIRED,
+            )
+            state['agent'] = agent_name
+            state['task_id'] = task.id
+        return responses
+
+    def _get_connection(self, agent_name: str) -> RemoteAgentConnections:
+        if agent_name not in self.remote_agent_connections:
+            raise ValueError(f'Agent {agent_name} not found')
+        client = self.remote_agent_connections[agent_name]
+        if not client:
+            raise ValueError(f'Client not available for {agent_name}')
+        return client
+
+    async def _send_remote_task(
+        self,
+        client: RemoteAgentConnections,
+        message: str,
+        state,
+        task_id: str,
+        message_id: str,
+    ) -> Task:
+        sessionId = state['session_id']
         metadata = {}
         if 'input_message_metadata' in state:
             metadata.update(**state['input_message_metadata'])
-            if 'message_id' in state['input_message_metadata']:
-                messageId = state['input_message_metadata']['message_id']
-        if not messageId:
-            messageId = str(uuid.uuid4())
-        metadata.update(conversation_id=sessionId, message_id=messageId)
+        metadata.update(conversation_id=sessionId, message_id=message_id)
         request: TaskSendParams = TaskSendParams(
-            id=taskId,
+            id=task_id,
             sessionId=sessionId,
             message=Message(
                 role='user',
@@ -182,60 +333,134 @@ Current agent: {current_agent['active_agent']}
             # pushNotification=None,
             metadata={'conversation_id': sessionId},
         )
-        task = await client.send_task(request, self.task_callback)
-        # Assume completion unless a state returns that isn't complete
-        state['session_active'] = task.status.state not in [
-            TaskState.COMPLETED,
-            TaskState.CANCELED,
-            TaskState.FAILED,
-            TaskState.UNKNOWN,
-        ]
-        if task.status.state == TaskState.INPUT_REQUIRED:
-            # Force user input back
-            tool_context.actions.skip_summarization = True
-            tool_context.actions.escalate = True
-        elif task.status.state == TaskState.CANCELED:
-            # Open question, should we return some info for cancellation instead
-            raise ValueError(f'Agent {agent_name} task {task.id} is cancelled')
-        elif task.status.state == TaskState.FAILED:
-            # Raise error for failure
-            raise ValueError(f'Agent {agent_name} task {task.id} failed')
-        response = []
-        if task.status.message:
-            # Assume the information is in the task message.
+        return await client.send_task(request, self.task_callback)
+
+
+def is_task_open(task: Task) -> bool:
+    """Returns whether the remote agent may still do more work on `task`."""
+    return task.status.state not in [
+        TaskState.COMPLETED,
+        TaskState.CANCELED,
+        TaskState.FAILED,
+        TaskState.UNKNOWN,
+    ]
+
+
+def get_task_error(agent_name: str, task: Task) -> str | None:
+    """Returns why `task` did not succeed, or None if it did not fail."""
+    if task.status.state == TaskState.CANCELED:
+        # Open question, should we return some info for cancellation instead
+        return f'Agent {agent_name} task {task.id} is cancelled'
+    if task.status.state == TaskState.FAILED:
+        return f'Agent {agent_name} task {task.id} failed'
+    return None
+
+
+def convert_task(task: Task, tool_context: ToolContext) -> list[ConvertedPart]:
+    """Converts the status message and artifacts of `task` for the model."""
+    response = []
+    # The status message and the artifacts often carry the same file, so
+    # each distinct file is decoded and saved only once per task.
+    saved_files: SavedFiles = {}
+    if task.status.message:
+        # Assume the information is in the task message.
+        response.extend(
+            convert_parts(task.status.message.parts, tool_context, saved_files)
+        )
+    if task.artifacts:
+        for artifact in task.artifacts:
             response.extend(
-                convert_parts(task.status.message.parts, tool_context)
+                convert_parts(artifact.parts, tool_context, saved_files)
+            )
+    return response
+
+
+def resolve_agent_cards(addresses: list[str]) -> list[AgentCard]:
+    """Fetches the agent cards for the given addresses concurrently.
+
+    Each fetch is an independent blocking HTTP round-trip, so they are issued
+    from a thread pool and startup waits on the slowest agent rather than the
+    sum of all of them. Cards are returned in the order of `addresses`.
+    """
+    if not addresses:
+        return []
+    with ThreadPoolExecutor(max_workers=len(addresses)) as executor:
+        return list(
+            executor.map(
+                lambda address: A2ACardResolver(address).get_agent_card(),
+                addresses,
             )
-        if task.artifacts:
-            for artifact in task.artifacts:
-                response.extend(convert_parts(artifact.parts, tool_context))
-        return response
+        )
 
 
-def convert_parts(parts: list[Part], tool_context: ToolContext):
+def convert_parts(
+    parts: list[Part],
+    tool_context: ToolContext,
+    saved_files: SavedFiles | None = None,
+) -> list[ConvertedPart]:
     rval = []
     for p in parts:
-        rval.append(convert_part(p, tool_context))
+        rval.append(convert_part(p, tool_context, saved_files))
     return rval
 
 
-def convert_part(part: Part, tool_context: ToolContext):
-    if part.type == 'text':
-        return part.text
-    if part.type == 'data':
-        return part.data
-    if part.type == 'file':
-        # Repackage A2A FilePart to google.genai Blob
-        # Currently not considering plain text as files
-        file_id = part.file.name
-        file_bytes = base64.b64decode(part.file.bytes)
-        file_part = types.Part(
-            inline_data=types.Blob(
-                mime_type=part.file.mimeType, data=file_bytes
-            )
-        )
-        tool_context.save_artifact(file_id, file_part)
-        tool_context.actions.skip_summarization = True
-        tool_context.actions.escalate = True
-        return DataPart(data={'artifact-file-id': file_id})
-    return f'Unknown type: {part.type}'
+def convert_part(
+    part: Part,
+    tool_context: ToolContext,
+    saved_files: SavedFiles | None = None,
+) -> ConvertedPart:
+    converter = _PART_CONVERTERS.get(part.type)
+    if converter is None:
+        return f'Unknown type: {part.type}'
+    return converter(part, tool_context, saved_files)
+
+
+def _convert_text_part(
+    part: Part,
+    tool_context: ToolContext,
+    saved_files: SavedFiles | None,
+) -> str:
+    return part.text
+
+
+def _convert_data_part(
+    part: Part,
+    tool_context: ToolContext,
+    saved_files: SavedFiles | None,
+) -> dict[str, Any]:
+    return part.data
+
+
+def _convert_file_part(
+    part: Part,
+    tool_context: ToolContext,
+    saved_files: SavedFiles | None,
+) -> DataPart:
+    # Repackage A2A FilePart to google.genai Blob
+    # Currently not considering plain text as files
+    file = part.file
+    file_id = file.name
+    if saved_files is not None and file_id in saved_files:
+        saved_bytes, saved_part = saved_files[file_id]
+        if saved_bytes == file.bytes:
+            return saved_part
+    file_bytes = base64.b64decode(file.bytes)
+    file_part = types.Part(
+        inline_data=types.Blob(mime_type=file.mimeType, data=file_bytes)
+    )
+    tool_context.save_artifact(file_id, file_part)
+    tool_context.actions.skip_summarization = True
+    tool_context.actions.escalate = True
+    rval = DataPart(data={'artifact-file-id': file_id})
+    if saved_files is not None and file_id:
+        saved_files[file_id] = (file.bytes, rval)
+    return rval
+
+
+_PART_CONVERTERS: dict[
+    str, Callable[[Part, ToolContext, SavedFiles | None], ConvertedPart]
+] = {
+    'text': _convert_text_part,
+    'data': _convert_data_part,
+    'file': _convert_file_part,
+}
@@ -1,6 +1,8 @@
 import uuid
 
-from collections.abc import Callable
+from collections.abc import AsyncIterable, Callable
+
+import httpx
 
 from common.client import A2AClient
 from common.types import (
@@ -21,8 +23,12 @@ TaskUpdateCallback = Callable[[TaskCallbackArg, AgentCard], Task]
 class RemoteAgentConnections:
     """A class to hold the connections to the remote agents."""
 
-    def __init__(self, agent_card: AgentCard):
-        self.agent_client = A2AClient(agent_card)
+    def __init__(
+        self,
+        agent_card: AgentCard,
+        httpx_client: httpx.AsyncClient | None = None,
+    ):
+        self.agent_client = A2AClient(agent_card, httpx_client=httpx_client)
         self.card = agent_card
 
         self.conversation_name = None
@@ -52,30 +58,9 @@ class RemoteAgentConnections:
                     ),
                     self.card,
                 )
-            async for response in self.agent_client.send_task_streaming(
-                request.model_dump()
-            ):
-                merge_metadata(response.result, request)
-                # For task status updates, we need to propagate metadata and provide
-                # a unique message id.
-                if (
-                    hasattr(response.result, 'status')
-                    and hasattr(response.result.status, 'message')
-                    and response.result.status.message
-                ):
-                    merge_metadata(
-                        response.result.status.message, request.message
-                    )
-                    m = response.result.status.message
-                    if not m.metadata:
-                        m.metadata = {}
-                    if 'message_id' in m.metadata:
-                        m.metadata['last_message_id'] = m.metadata['message_id']
-                    m.metadata['message_id'] = str(uuid.uuid4())
+            async for result in self.send_task_streaming(request):
                 if task_callback:
-                    task = task_callback(response.result, self.card)
-                if hasattr(response.result, 'final') and response.result.final:
-                    break
+                    task = task_callback(result, self.card)
             return task
         # Non-streaming
         response = await self.agent_client.send_task(request.model_dump())
@@ -93,12 +78,41 @@ class RemoteAgentConnections:
                 m.metadata = {}
             if 'message_id' in m.metadata:
                 m.metadata['last_message_id'] = m.metadata['message_id']
-            m.metadata['message_id'] = str(uuid.uuid4())
+            m.metadata['message_id'] = uuid.uuid4().hex
 
         if task_callback:
             task_callback(response.result, self.card)
         return response.result
 
+    async def send_task_streaming(
+        self, request: TaskSendParams
+    ) -> AsyncIterable[TaskCallbackArg]:
+        """Yields each update from the remote agent as soon as it arrives.
+
+        The stream ends after the remote agent reports a final update.
+        """
+        async for response in self.agent_client.send_task_streaming(
+            request.model_dump()
+        ):
+            merge_metadata(response.result, request)
+            # For task status updates, we need to propagate metadata and provide
+            # a unique message id.
+            if (
+                hasattr(response.result, 'status')
+                and hasattr(response.result.status, 'message')
+                and response.result.status.message
+            ):
+                merge_metadata(response.result.status.message, request.message)
+                m = response.result.status.message
+                if not m.metadata:
+                    m.metadata = {}
+                if 'message_id' in m.metadata:
+                    m.metadata['last_message_id'] = m.metadata['message_id']
+                m.metadata['message_id'] = uuid.uuid4().hex
+            yield response.result
+            if hasattr(response.result, 'final') and response.result.final:
+                break
+
 
 def merge_metadata(target, source):
     if not hasattr(target, 'metadata') or not hasattr(source, 'metadata'):
@@ -0,0 +1,172 @@
+import asyncio
+import json
+import threading
+import unittest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from common.client import A2AClient
+from common.types import (
+    GetTaskResponse,
+    SendTaskStreamingResponse,
+    Task,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+)
+
+
+def task_response(request_id):
+    task = Task(id='test_task', status=TaskStatus(state=TaskState.COMPLETED))
+    return {
+        'jsonrpc': '2.0',
+        'id': request_id,
+        'result': task.model_dump(exclude_none=True),
+    }
+
+
+class TestA2AClient(unittest.IsolatedAsyncioTestCase):
+    async def test_requests_share_one_httpx_client(self):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            body = json.loads(request.content)
+            return httpx.Response(200, json=task_response(body['id']))
+
+        httpx_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = A2AClient(url='http://agent/', httpx_client=httpx_client)
+        for _ in range(3):
+            response = await client.get_task({'id': 'test_task'})
+            self.assertIsInstance(response, GetTaskResponse)
+            self.assertEqual(response.result.id, 'test_task')
+        self.assertEqual(len(seen), 3)
+
+        # A shared client is owned by the caller and must stay open.
+        self.assertFalse(httpx_client.is_closed)
+        await httpx_client.aclose()
+
+    async def test_send_task_streaming(self):
+        events = [
+            TaskStatusUpdateEvent(
+                id='test_task',
+                status=TaskStatus(state=state),
+                final=state == TaskState.COMPLETED,
+            )
+            for state in (TaskState.WORKING, TaskState.COMPLETED)
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            data = ''.join(
+                'data: '
+                + SendTaskStreamingResponse(
+                    id=body['id'], result=event
+                ).model_dump_json(exclude_none=True)
+                + '\n\n'
+                for event in events
+            )
+            return httpx.Response(
+                200,
+                content=data.encode(),
+                headers={'content-type': 'text/event-stream'},
+            )
+
+        httpx_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = A2AClient(url='http://agent/', httpx_client=httpx_client)
+        responses = [
+            response
+            async for response in client.send_task_streaming(
+                {
+                    'id': 'test_task',
+                    'message': {
+                        'role': 'user',
+                        'parts': [{'type': 'text', 'text': 'hi'}],
+                    },
+                }
+            )
+        ]
+        self.assertEqual(
+            [r.result.status.state for r in responses],
+            [TaskState.WORKING, TaskState.COMPLETED],
+        )
+        await httpx_client.aclose()
+
+    async def test_streaming_does_not_leak_sse_headers(self):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            body = json.loads(request.content)
+            if body['method'] == 'tasks/get':
+                return httpx.Response(200, json=task_response(body['id']))
+            event = TaskStatusUpdateEvent(
+                id='test_task',
+                status=TaskStatus(state=TaskState.COMPLETED),
+                final=True,
+            )
+            data = SendTaskStreamingResponse(
+                id=body['id'], result=event
+            ).model_dump_json(exclude_none=True)
+            return httpx.Response(
+                200,
+                content=f'data: {data}\n\n'.encode(),
+                headers={'content-type': 'text/event-stream'},
+            )
+
+        httpx_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = A2AClient(url='http://agent/', httpx_client=httpx_client)
+        async for _ in client.send_task_streaming(
+            {
+                'id': 'test_task',
+                'message': {
+                    'role': 'user',
+                    'parts': [{'type': 'text', 'text': 'hi'}],
+                },
+            }
+        ):
+            pass
+        await client.get_task({'id': 'test_task'})
+
+        stream_request, get_request = seen
+        self.assertEqual(stream_request.headers['accept'], 'text/event-stream')
+        self.assertNotEqual(get_request.headers['accept'], 'text/event-stream')
+        self.assertNotIn('cache-control', get_request.headers)
+        await httpx_client.aclose()
+
+
+class TaskHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive, so a pooled client would reuse them.
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        data = json.dumps(task_response(body['id'])).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestA2AClientEventLoops(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), TaskHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_client_works_from_consecutive_event_loops(self):
+        # Mirrors callers that run each request under its own asyncio.run.
+        client = A2AClient(url=self.url)
+        for _ in range(2):
+            response = asyncio.run(client.get_task({'id': 'test_task'}))
+            self.assertEqual(response.result.id, 'test_task')
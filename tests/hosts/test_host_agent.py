@@ -0,0 +1,248 @@
+import asyncio
+import base64
+import unittest
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+
+pytest.importorskip('google.adk')
+
+from common.types import (
+    DataPart,
+    FileContent,
+    FilePart,
+    Message,
+    Task,
+    TaskState,
+    TaskStatus,
+    TextPart,
+)
+from hosts.multiagent.host_agent import HostAgent, convert_parts
+
+
+def make_tool_context(state=None):
+    return SimpleNamespace(
+        state={} if state is None else state,
+        actions=SimpleNamespace(skip_summarization=False, escalate=False),
+        save_artifact=mock.Mock(),
+    )
+
+
+def file_part(name, data):
+    return FilePart(
+        file=FileContent(
+            name=name,
+            mimeType='image/png',
+            bytes=base64.b64encode(data).decode(),
+        )
+    )
+
+
+class TestConvertFileParts(unittest.TestCase):
+    def test_identical_file_is_saved_once(self):
+        tool_context = make_tool_context()
+        saved_files = {}
+        first = convert_parts(
+            [file_part('image.png', b'png')], tool_context, saved_files
+        )
+        second = convert_parts(
+            [file_part('image.png', b'png')], tool_context, saved_files
+        )
+        self.assertEqual(first, second)
+        self.assertEqual(
+            first, [DataPart(data={'artifact-file-id': 'image.png'})]
+        )
+        tool_context.save_artifact.assert_called_once()
+
+    def test_same_name_with_new_payload_is_saved_again(self):
+        tool_context = make_tool_context()
+        saved_files = {}
+        convert_parts(
+            [file_part('image.png', b'old')], tool_context, saved_files
+        )
+        convert_parts(
+            [file_part('image.png', b'new')], tool_context, saved_files
+        )
+        self.assertEqual(tool_context.save_artifact.call_count, 2)
+        _, saved = tool_context.save_artifact.call_args.args
+        self.assertEqual(saved.inline_data.data, b'new')
+
+
+class FakeConnection:
+    def __init__(self, state=TaskState.COMPLETED, error=None):
+        self.state = state
+        self.error = error
+        self.requests = []
+
+    async def send_task(self, request, task_callback):
+        self.requests.append(request)
+        if self.error:
+            raise self.error
+        return Task(
+            id=request.id,
+            sessionId=request.sessionId,
+            status=TaskStatus(
+                state=self.state,
+                message=Message(
+                    role='agent', parts=[TextPart(text=self.state.value)]
+                ),
+            ),
+        )
+
+
+class BlockingConnection(FakeConnection):
+    """Holds each task open until `release` is set."""
+
+    def __init__(self, release, running):
+        super().__init__()
+        self.release = release
+        self.running = running
+
+    async def send_task(self, request, task_callback):
+        self.running.append(request.id)
+        await self.release.wait()
+        return await super().send_task(request, task_callback)
+
+
+class TestSendTasks(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.host_agent = HostAgent([])
+        self.addAsyncCleanup(self.host_agent.aclose)
+        self.tool_context = make_tool_context(
+            {
+                'session_id': 'session',
+                'task_id': 'active_task',
+                'agent': 'previous',
+                'input_message_metadata': {'message_id': 'user_message'},
+            }
+        )
+
+    def add_agents(self, **connections):
+        self.host_agent.remote_agent_connections.update(connections)
+
+    async def test_each_task_gets_its_own_ids(self):
+        first, second = FakeConnection(), FakeConnection()
+        self.add_agents(first=first, second=second)
+        await self.host_agent.send_tasks(
+            ['first', 'second'], ['a', 'b'], self.tool_context
+        )
+        requests = first.requests + second.requests
+        task_ids = {r.id for r in requests}
+        message_ids = {r.message.metadata['message_id'] for r in requests}
+        self.assertEqual(len(task_ids), 2)
+        self.assertNotIn('active_task', task_ids)
+        self.assertEqual(len(message_ids), 2)
+        self.assertNotIn('user_message', message_ids)
+
+    async def test_failures_are_reported_per_task(self):
+        self.add_agents(
+            ok=FakeConnection(),
+            broken=FakeConnection(error=RuntimeError('connection lost')),
+            failed=FakeConnection(TaskState.FAILED),
+        )
+        responses = await self.host_agent.send_tasks(
+            ['ok', 'broken', 'failed', 'missing'],
+            ['a', 'b', 'c', 'd'],
+            self.tool_context,
+        )
+        self.assertEqual(
+            responses[0], {'agent_name': 'ok', 'response': ['completed']}
+        )
+        self.assertEqual(
+            responses[1], {'agent_name': 'broken', 'error': 'connection lost'}
+        )
+        self.assertEqual(responses[2]['agent_name'], 'failed')
+        self.assertIn('failed', responses[2]['error'])
+        self.assertEqual(
+            responses[3],
+            {'agent_name': 'missing', 'error': 'Agent missing not found'},
+        )
+        self.assertFalse(self.tool_context.state['session_active'])
+        self.assertEqual(self.tool_context.state['agent'], 'previous')
+
+    async def test_first_open_task_becomes_active(self):
+        working = FakeConnection(TaskState.WORKING)
+        self.add_agents(
+            done=FakeConnection(),
+            working=working,
+            also_working=FakeConnection(TaskState.WORKING),
+        )
+        await self.host_agent.send_tasks(
+            ['done', 'working', 'also_working'],
+            ['a', 'b', 'c'],
+            self.tool_context,
+        )
+        state = self.tool_context.state
+        self.assertTrue(state['session_active'])
+        self.assertEqual(state['agent'], 'working')
+        self.assertEqual(state['task_id'], working.requests[0].id)
+        self.assertFalse(self.tool_context.actions.escalate)
+
+    async def test_task_requiring_input_can_be_resumed(self):
+        asking = FakeConnection(TaskState.INPUT_REQUIRED)
+        self.add_agents(
+            working=FakeConnection(TaskState.WORKING), asking=asking
+        )
+        await self.host_agent.send_tasks(
+            ['working', 'asking'], ['a', 'b'], self.tool_context
+        )
+        state = self.tool_context.state
+        self.assertEqual(state['agent'], 'asking')
+        self.assertTrue(self.tool_context.actions.escalate)
+        self.assertTrue(self.tool_context.actions.skip_summarization)
+
+        # The user's answer goes on to the task that asked for it.
+        await self.host_agent.send_task('asking', 'answer', self.tool_context)
+        first, answer = asking.requests
+        self.assertEqual(answer.id, first.id)
+
+    async def test_tasks_overlap_up_to_the_limit(self):
+        release = asyncio.Event()
+        running = []
+        names = ['first', 'second', 'third']
+        limit = 2
+        self.add_agents(
+            **{name: BlockingConnection(release, running) for name in names}
+        )
+        with mock.patch(
+            'hosts.multiagent.host_agent.MAX_CONCURRENT_TASKS', limit
+        ):
+            sending = asyncio.create_task(
+                self.host_agent.send_tasks(
+                    names, ['a', 'b', 'c'], self.tool_context
+                )
+            )
+            async with asyncio.timeout(1):
+                while len(running) < limit:
+                    await asyncio.sleep(0)
+            # Give the third task every chance to start early.
+            for _ in range(10):
+                await asyncio.sleep(0)
+            self.assertEqual(len(running), limit)
+            release.set()
+            responses = await sending
+        self.assertEqual(len(running), 3)
+        self.assertEqual(
+            [response['response'] for response in responses],
+            [['completed']] * 3,
+        )
+
+    async def test_malformed_entries_are_reported_per_task(self):
+        connection = FakeConnection()
+        self.add_agents(first=connection)
+        responses = await self.host_agent.send_tasks(
+            ['first', 'first', ''], ['a', '', 'c', 'd'], self.tool_context
+        )
+        self.assertEqual(
+            responses,
+            [
+                {'agent_name': 'first', 'response': ['completed']},
+                {'agent_name': 'first', 'error': 'No message for agent first'},
+                {'agent_name': '', 'error': "No agent name for message 'c'"},
+                {'agent_name': '', 'error': "No agent name for message 'd'"},
+            ],
+        )
+        self.assertEqual(len(connection.requests), 1)
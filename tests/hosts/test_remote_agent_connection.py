@@ -0,0 +1,85 @@
+import unittest
+
+from common.types import (
+    AgentCapabilities,
+    AgentCard,
+    Message,
+    SendTaskStreamingResponse,
+    Task,
+    TaskSendParams,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+from hosts.multiagent.remote_agent_connection import RemoteAgentConnections
+
+
+class FakeA2AClient:
+    """Streams the given events, counting how many it has produced."""
+
+    def __init__(self, events):
+        self.events = events
+        self.sent = 0
+
+    async def send_task_streaming(self, payload):
+        for event in self.events:
+            self.sent += 1
+            yield SendTaskStreamingResponse(id=payload['id'], result=event)
+
+
+def status_event(state, final=False):
+    return TaskStatusUpdateEvent(
+        id='test_task', status=TaskStatus(state=state), final=final
+    )
+
+
+class TestRemoteAgentConnections(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        card = AgentCard(
+            name='Test Agent',
+            url='http://agent/',
+            version='1.0.0',
+            capabilities=AgentCapabilities(streaming=True),
+            skills=[],
+        )
+        self.connection = RemoteAgentConnections(card)
+        self.remote = FakeA2AClient(
+            [
+                status_event(TaskState.WORKING),
+                status_event(TaskState.WORKING),
+                status_event(TaskState.COMPLETED, final=True),
+                # Anything after the final update is never read.
+                status_event(TaskState.WORKING),
+            ]
+        )
+        self.connection.agent_client = self.remote
+        self.request = TaskSendParams(
+            id='test_task',
+            sessionId='session',
+            message=Message(role='user', parts=[TextPart(text='hi')]),
+        )
+
+    async def test_updates_are_yielded_as_they_arrive(self):
+        states = []
+        async for result in self.connection.send_task_streaming(self.request):
+            # The remote has produced nothing beyond the update in hand.
+            self.assertEqual(self.remote.sent, len(states) + 1)
+            states.append(result.status.state)
+        self.assertEqual(
+            states,
+            [TaskState.WORKING, TaskState.WORKING, TaskState.COMPLETED],
+        )
+        self.assertEqual(self.remote.sent, 3)
+
+    async def test_send_task_forwards_each_update(self):
+        sent_at_callback = []
+
+        def task_callback(result, card):
+            sent_at_callback.append(self.remote.sent)
+            return Task(id=result.id, status=result.status)
+
+        task = await self.connection.send_task(self.request, task_callback)
+        # The submitted task, then each update before the next is streamed.
+        self.assertEqual(sent_at_callback, [0, 1, 2, 3])
+        self.assertEqual(task.status.state, TaskState.COMPLETED)
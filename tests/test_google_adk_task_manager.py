@@ -0,0 +1,162 @@
+"""Tests for the ADK agent task manager."""
+
+import asyncio
+import unittest
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+
+pytest.importorskip('google.genai')
+
+from agents.google_adk.task_manager import AgentWithTaskManager
+from google.genai import types
+
+
+def text(value):
+    return types.Part.from_text(text=value)
+
+
+def function_response(result):
+    return types.Part(
+        function_response=types.FunctionResponse(
+            name='tool', response={'result': result}
+        )
+    )
+
+
+def function_call():
+    return types.Part(function_call=types.FunctionCall(name='tool', args={}))
+
+
+def event(*parts, final=False):
+    return SimpleNamespace(
+        content=types.Content(role='model', parts=list(parts)),
+        is_final_response=lambda: final,
+    )
+
+
+class FakeSessionService:
+    def get_session(self, app_name, user_id, session_id):
+        return None
+
+    def create_session(self, app_name, user_id, state, session_id):
+        return SimpleNamespace(id=session_id)
+
+
+class FakeRunner:
+    """Yields the given events; a number pauses for that many seconds."""
+
+    def __init__(self, events):
+        self.events = events
+        self.session_service = FakeSessionService()
+
+    async def run_async(self, user_id, session_id, new_message):
+        for item in self.events:
+            if isinstance(item, float):
+                await asyncio.sleep(item)
+            else:
+                yield item
+
+
+class FakeAgent(AgentWithTaskManager):
+    def __init__(self, events):
+        self._agent = SimpleNamespace(name='fake_agent')
+        self._user_id = 'user'
+        self._runner = FakeRunner(events)
+
+    def get_processing_message(self):
+        return 'Processing...'
+
+
+async def stream(*events):
+    agent = FakeAgent(list(events))
+    return [item async for item in agent.stream('query', 'session')]
+
+
+class TestStreamFinalResponse(unittest.IsolatedAsyncioTestCase):
+    async def final_content(self, *parts):
+        items = await stream(event(*parts, final=True))
+        self.assertEqual(len(items), 1)
+        self.assertTrue(items[0]['is_task_complete'])
+        return items[0]['content']
+
+    async def test_text_parts_are_joined(self):
+        content = await self.final_content(text('a'), text('b'))
+        self.assertEqual(content, 'a\nb')
+
+    async def test_function_response(self):
+        content = await self.final_content(function_response('done'))
+        self.assertEqual(content['name'], 'tool')
+        self.assertEqual(content['response'], {'result': 'done'})
+
+    async def test_text_after_function_response_is_not_used(self):
+        content = await self.final_content(
+            function_response('done'), text('ignored')
+        )
+        self.assertEqual(content['response'], {'result': 'done'})
+
+    async def test_text_that_is_not_first_is_not_used(self):
+        content = await self.final_content(function_call(), text('ignored'))
+        self.assertEqual(content, '')
+
+
+class TestInvoke(unittest.IsolatedAsyncioTestCase):
+    async def test_returns_text_of_last_event(self):
+        agent = FakeAgent(
+            [event(text('thinking')), event(text('a'), text('b'), final=True)]
+        )
+        self.assertEqual(await agent.invoke('query', 'session'), 'a\nb')
+
+    async def test_last_event_without_text(self):
+        agent = FakeAgent(
+            [event(text('thinking')), event(function_response('done'))]
+        )
+        self.assertEqual(await agent.invoke('query', 'session'), '')
+
+    async def test_no_events(self):
+        agent = FakeAgent([])
+        self.assertEqual(await agent.invoke('query', 'session'), '')
+
+
+class TestStreamProcessingUpdates(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = mock.patch(
+            'agents.google_adk.task_manager.PROCESSING_UPDATE_INTERVAL', 0.05
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def updates(self, *events):
+        items = await stream(*events, event(text('done'), final=True))
+        self.assertEqual(
+            items[-1], {'is_task_complete': True, 'content': 'done'}
+        )
+        return items[:-1]
+
+    async def test_updates_inside_the_interval_are_dropped(self):
+        updates = await self.updates(
+            event(text('a')), event(text('b')), event(text('c'))
+        )
+        self.assertEqual(
+            updates, [{'is_task_complete': False, 'updates': 'Processing...'}]
+        )
+
+    async def test_update_past_the_interval_is_sent(self):
+        updates = await self.updates(
+            event(text('a')),
+            event(text('b')),
+            0.1,
+            event(text('c')),
+            event(text('d')),
+        )
+        self.assertEqual(len(updates), 2)
+        self.assertTrue(all(not u['is_task_complete'] for u in updates))
+
+    async def test_final_response_is_never_dropped(self):
+        items = await stream(event(text('a')), event(text('done'), final=True))
+        self.assertEqual(
+            [item['is_task_complete'] for item in items], [False, True]
+        )